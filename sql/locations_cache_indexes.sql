@@ -0,0 +1,52 @@
+-- ============================================================
+-- Locations Cache Indexes
+-- ============================================================
+-- geocode_listings.py checks each batch of candidate addresses
+-- against public.locations_cache with address_key = ANY(...),
+-- which a unique btree on address_key answers with index
+-- lookups. Including latitude/longitude lets lookups that also
+-- read coordinates (e.g. the map view's join) be answered by an
+-- index-only scan.
+--
+-- NOTE: When address_key is the table's PRIMARY KEY (as in the
+-- README), this index deliberately duplicates the primary key
+-- index on the same column, purely to carry the INCLUDE columns.
+-- The tradeoff is write cost: every upsert now maintains two
+-- btrees on address_key (plus the included coordinates). The
+-- geocoder writes at most a few thousand rows per run while the
+-- map reads the cache constantly, so the extra write is accepted.
+-- If index-only coordinate lookups are not needed, skip step 1
+-- and rely on the primary key index alone.
+--
+-- IMPORTANT: CREATE/DROP INDEX CONCURRENTLY cannot run inside a
+-- transaction block. Run each statement below on its own (e.g.
+-- one at a time in the SQL Editor, or via psql).
+-- ============================================================
+
+-- 1. Covering unique index on the cache key
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS locations_cache_address_key_idx
+    ON public.locations_cache (address_key)
+    INCLUDE (latitude, longitude);
+
+-- 2. Drop the earlier plain index, now superseded by the one above
+DROP INDEX CONCURRENTLY IF EXISTS public.idx_locations_cache_address_key;
+
+-- ============================================================
+-- Verification
+-- ============================================================
+-- The plan should show an Index Only Scan using
+-- locations_cache_address_key_idx rather than a Seq Scan:
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT address_key
+FROM public.locations_cache
+WHERE address_key = ANY(ARRAY['1 MAIN ST', '2 BROADWAY']::text[]);
+
+-- ============================================================
+-- Instructions for Running This SQL
+-- ============================================================
+-- 1. Go to https://supabase.com/dashboard
+-- 2. Select your project
+-- 3. Navigate to SQL Editor
+-- 4. Run statements 1 and 2 one at a time (see note above)
+-- 5. Run the verification query and check the plan
+-- ============================================================
@@ -0,0 +1,45 @@
+-- ============================================================
+-- Locations Cache Key Normalization Trigger
+-- ============================================================
+-- Normalizes public.locations_cache.address_key to
+-- UPPER(TRIM(address)) on every insert and update, so the cache
+-- always matches marts.unified_listings_vw.address_key no matter
+-- which client writes to it.
+--
+-- With the key guaranteed canonical, lookups against the cache
+-- (the geocoder's ANY(...) check and the map view's join) compare
+-- plain columns and can use the address_key btree index.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION public.normalize_address_key()
+RETURNS trigger AS $$
+BEGIN
+    NEW.address_key := UPPER(BTRIM(NEW.address_key));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS normalize_address_key ON public.locations_cache;
+
+CREATE TRIGGER normalize_address_key
+    BEFORE INSERT OR UPDATE OF address_key ON public.locations_cache
+    FOR EACH ROW
+    EXECUTE FUNCTION public.normalize_address_key();
+
+-- ============================================================
+-- Verification
+-- ============================================================
+-- Should return 0 rows once existing keys are canonical:
+SELECT address_key
+FROM public.locations_cache
+WHERE address_key <> UPPER(BTRIM(address_key));
+
+-- ============================================================
+-- Instructions for Running This SQL
+-- ============================================================
+-- 1. Go to https://supabase.com/dashboard
+-- 2. Select your project
+-- 3. Navigate to SQL Editor
+-- 4. Copy and paste this entire file
+-- 5. Click "Run" to execute
+-- ============================================================
@@ -13,6 +13,8 @@
 -- 4. Uses actual bedrooms/bathrooms fields from uws_listings_vw (cast to text)
 -- 5. Includes contact extraction (contact, contact_name, keys_access)
 -- 6. Restores ALL original permissions exactly as they were
+-- 7. Exposes the normalized address_key (UPPER(TRIM(address))) used by
+--    geocode_listings.py and public.locations_cache
 --
 -- DEPENDENCIES:
 -- - marts.solil_listings_vw (must exist)
@@ -203,7 +205,9 @@ SELECT
   ) AS description_combined,
   solil_listings_vw.filename,
   solil_listings_vw.filename_date,
-  solil_listings_vw.created_at
+  solil_listings_vw.created_at,
+  -- Normalized cache key, matches public.locations_cache.address_key
+  UPPER(TRIM(solil_listings_vw.address)) AS address_key
 FROM
   marts.solil_listings_vw
 
@@ -274,7 +278,9 @@ SELECT
   ) AS description_combined,
   uws_listings_vw.filename,
   uws_listings_vw.filename_date,
-  uws_listings_vw.created_at
+  uws_listings_vw.created_at,
+  -- Normalized cache key, matches public.locations_cache.address_key
+  UPPER(TRIM(uws_listings_vw.address)) AS address_key
 FROM
   marts.uws_listings_vw;
 
@@ -287,6 +293,7 @@ WITH
     SELECT
       v.source_name,
       v.address,
+      v.address_key,
       v.unit_number,
       v.rent_price,
       v.bedrooms,
@@ -307,6 +314,7 @@ WITH
     SELECT
       ranked_listings.source_name,
       ranked_listings.address,
+      ranked_listings.address_key,
       ranked_listings.unit_number,
       ranked_listings.rent_price,
       ranked_listings.bedrooms,
@@ -381,9 +389,7 @@ FROM
   LEFT JOIN previous_records p ON l.source_name = p.source_name
   AND l.address = p.address
   AND NOT l.unit_number IS DISTINCT FROM p.unit_number
-  JOIN locations_cache loc ON UPPER(
-    TRIM(BOTH FROM l.address)
-  ) = loc.address_key;
+  JOIN locations_cache loc ON l.address_key = loc.address_key;
 
 -- ============================================================
 -- STEP 5: Restore All Permissions (EXACT MATCH)